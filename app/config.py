@@ -1,8 +1,9 @@
 """
 app/config.py — Centralised application settings loaded from environment variables
 """
-from typing import List
-from pydantic import field_validator
+from functools import cached_property, lru_cache
+
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,11 +16,14 @@ class Settings(BaseSettings):
     @classmethod
     def fix_postgres_protocol(cls, v: str) -> str:
         """Remplace postgres:// par postgresql:// pour SQLAlchemy 2.0+"""
-        if isinstance(v, str) and v.startswith("postgres://"):
-            return v.replace("postgres://", "postgresql+psycopg2://", 1)
+        if not isinstance(v, str):
+            return v
+        if v.startswith("postgres://"):
+            return "postgresql+psycopg2://" + v[len("postgres://"):]
         # S'assurer que psycopg2 est bien spécifié comme driver
-        if isinstance(v, str) and "postgresql://" in v and "+psycopg2" not in v:
-            return v.replace("postgresql://", "postgresql+psycopg2://", 1)
+        # (un schéma "postgresql+<driver>://" ne commence pas par "postgresql://")
+        if v.startswith("postgresql://"):
+            return "postgresql+psycopg2://" + v[len("postgresql://"):]
         return v
 
     # ── JWT (MUST be set in Railway variables for production) ─────────────────
@@ -27,6 +31,11 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
 
+    # ── Password hashing ──────────────────────────────────────────────────────
+    # Coût bcrypt (log2 des itérations) — 12 ≈ 250 ms par hash sur un CPU standard
+    # bcrypt n'accepte que 4..31
+    BCRYPT_ROUNDS: int = Field(12, ge=4, le=31)
+
     # ── CORS ──────────────────────────────────────────────────────────────────
     # Ajoutez l'URL de votre Vercel dans les variables Railway sous le nom ALLOWED_ORIGINS
     ALLOWED_ORIGINS: str = "http://localhost:3000,http://127.0.0.1:3000"
@@ -39,16 +48,26 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=True,
-        extra="ignore" # Ignore les variables supplémentaires envoyées par Railway
+        extra="ignore", # Ignore les variables supplémentaires envoyées par Railway
+        frozen=True,    # settings are immutable after boot — keeps cached values valid
     )
 
-    @property
-    def cors_origins(self) -> List[str]:
-        """Parse comma-separated CORS origins, handling edge cases."""
+    @cached_property
+    def cors_origins(self) -> tuple[str, ...]:
+        """Parse comma-separated CORS origins once, handling edge cases.
+
+        Returned as a tuple so the cached value can't be mutated by callers.
+        """
         if not self.ALLOWED_ORIGINS or not isinstance(self.ALLOWED_ORIGINS, str):
-            return []
-        origins = [o.strip() for o in self.ALLOWED_ORIGINS.split(",") if o.strip()]
-        return origins if origins else []
+            return ()
+        return tuple(o.strip() for o in self.ALLOWED_ORIGINS.split(",") if o.strip())
+
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings, built lazily on first access.
 
-settings = Settings()
+    Usable as a FastAPI dependency; tests can reset it with
+    ``get_settings.cache_clear()``.
+    """
+    return Settings()
@@ -3,22 +3,31 @@ app/core/security.py — Password hashing (bcrypt) and JWT utilities.
 """
 import logging
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+import jwt
 
-from app.config import settings
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
-# ── bcrypt context ────────────────────────────────────────────────────────────
-# rounds=12 provides strong security
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
+# ── bcrypt ────────────────────────────────────────────────────────────────────
+# Cost factor comes from BCRYPT_ROUNDS (default 12 — strong security).
+# Only bcrypt is ever used, so the `bcrypt` package is called directly.
 
-# bcrypt limitation
+# bcrypt limitation: only the first 72 bytes of the secret are significant
 MAX_BCRYPT_LENGTH = 72
 
+# Modular-crypt identifiers of the bcrypt variants checkpw accepts
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+
+def _encode_secret(plain: str) -> bytes:
+    """UTF-8 encode and truncate to bcrypt's 72-byte limit (same as passlib did)."""
+    return plain.encode("utf-8")[:MAX_BCRYPT_LENGTH]
+
 
 def hash_password(plain: str) -> str:
     """Return the bcrypt hash of a plain-text password.
@@ -33,8 +42,8 @@ def hash_password(plain: str) -> str:
         ValueError: If hashing fails
     """
     try:
-        truncated = plain[:MAX_BCRYPT_LENGTH]
-        return pwd_context.hash(truncated)
+        salt = bcrypt.gensalt(rounds=get_settings().BCRYPT_ROUNDS)
+        return bcrypt.hashpw(_encode_secret(plain), salt).decode("utf-8")
     except Exception as e:
         logger.error(f"Password hashing failed: {type(e).__name__}")
         raise ValueError("HASHING_ERROR") from e
@@ -50,33 +59,72 @@ def verify_password(plain: str, hashed: str) -> bool:
     Returns:
         True if passwords match, False otherwise
     """
+    if not hashed.startswith(BCRYPT_PREFIXES):
+        return False
     try:
-        truncated = plain[:MAX_BCRYPT_LENGTH]
-        return pwd_context.verify(truncated, hashed)
+        return bcrypt.checkpw(_encode_secret(plain), hashed.encode("utf-8"))
     except Exception as e:
         logger.warning(f"Password verification failed: {type(e).__name__}")
         return False
 
 
+@lru_cache(maxsize=1)
+def _dummy_hash(rounds: int) -> str:
+    """Real bcrypt hash at the given cost, checked for unknown-user logins.
+
+    Keyed on `rounds` so it follows BCRYPT_ROUNDS after get_settings.cache_clear().
+    """
+    return bcrypt.hashpw(b"x" * 16, bcrypt.gensalt(rounds=rounds)).decode("utf-8")
+
+
+def prepare_dummy_hash() -> None:
+    """Build the dummy hash ahead of time (called at startup).
+
+    Otherwise the first unknown-user login would also pay for hashpw,
+    taking twice as long as any other failed login.
+    """
+    _dummy_hash(get_settings().BCRYPT_ROUNDS)
+
+
+def verify_password_or_dummy(plain: str, hashed: Optional[str]) -> bool:
+    """Like verify_password, but spends a full bcrypt check for unknown users too.
+
+    A missing account costs the same bcrypt work as a wrong password, so
+    response time doesn't reveal whether the email is registered.
+
+    Args:
+        plain: Plain-text password from user
+        hashed: Hashed password from database, or None if the user is unknown
+
+    Returns:
+        True only if `hashed` is set and the password matches it
+    """
+    if hashed is None:
+        verify_password(plain, _dummy_hash(get_settings().BCRYPT_ROUNDS))
+        return False
+    return verify_password(plain, hashed)
+
+
 # ── JWT ───────────────────────────────────────────────────────────────────────
 def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
     """Sign a JWT token whose subject is the user's email."""
-    expire = datetime.now(tz=timezone.utc) + (
-        expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    )
+    settings = get_settings()
+    now = datetime.now(tz=timezone.utc)
+    expire = now + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
     payload = {
         "sub": subject,
         "exp": expire,
-        "iat": datetime.now(tz=timezone.utc),
+        "iat": now,
     }
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
 def decode_access_token(token: str) -> Optional[str]:
     """Decode + validate a JWT. Returns the subject (email) or None if invalid."""
+    settings = get_settings()
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         return payload.get("sub")
-    except JWTError as e:
+    except jwt.InvalidTokenError as e:
         logger.debug(f"JWT decode error: {type(e).__name__}")
         return None
@@ -6,7 +6,7 @@ from typing import Generator
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session, DeclarativeBase
 
-from app.config import settings
+from app.config import get_settings
 
 
 # ── Declarative base (all models inherit from this) ──────────────────────────
@@ -16,10 +16,15 @@ class Base(DeclarativeBase):
 
 # ── Engine ───────────────────────────────────────────────────────────────────
 engine = create_engine(
-    settings.DATABASE_URL,
+    get_settings().DATABASE_URL,
     pool_pre_ping=True,   # detect stale connections
     pool_recycle=3600,
+    pool_size=10,         # persistent connections kept open
+    max_overflow=20,      # extra connections allowed under burst load
+    pool_timeout=30,      # seconds to wait for a free connection
+    query_cache_size=1200,  # compiled-statement cache shared across requests
     echo=False,
+    connect_args={"options": "-c jit=off"},  # psycopg2: skip PG JIT for tiny OLTP queries
 )
 
 # ── Session factory ──────────────────────────────────────────────────────────
@@ -6,16 +6,18 @@ Registers:
   - /api/auth router (register + login)
   - /health endpoint
   - Auto-creates DB tables on startup (dev convenience)
+  - Precomputes the bcrypt dummy hash used for unknown-user logins
 """
 import os
+import json
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
-from app.config import settings
+from app.config import get_settings
+from app.core.security import prepare_dummy_hash
 from app.database import engine, Base
 from fastapi.responses import PlainTextResponse
 
@@ -40,11 +42,15 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Failed to create database tables: {e}")
         raise
+    # Precompute the bcrypt dummy hash so unknown-user logins cost the same from the start
+    prepare_dummy_hash()
     yield
     logger.info("👋 BrieflyAI API shutting down.")
 
 
 # ── App instance ──────────────────────────────────────────────────────────────
+settings = get_settings()
+
 app = FastAPI(
     title=settings.APP_TITLE,
     version=settings.APP_VERSION,
@@ -57,8 +63,8 @@ app = FastAPI(
 # ── CORS (must be before routers) ─────────────────────────────────────────────
 app.add_middleware(
     CORSMiddleware,
-    # allow_origins=settings.cors_origins,      # e.g. ["http://localhost:3000"]
-    allow_origins=["*"],      # e.g. ["http://localhost:3000"]
+    # Parsed once from ALLOWED_ORIGINS; falls back to "*" when none are configured
+    allow_origins=settings.cors_origins or ("*",),  # e.g. ("http://localhost:3000",)
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
     allow_headers=["*"],
@@ -71,18 +77,30 @@ app.include_router(auth_router, prefix="/api")
 
 
 # ── Health check ──────────────────────────────────────────────────────────────
+# Static bodies, serialised once — probes hit these every few seconds
+# (same compact, non-ASCII-escaping encoding as JSONResponse)
+def _json_bytes(content: dict) -> bytes:
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+_HEALTH_BODY = _json_bytes(
+    {"status": "ok", "service": settings.APP_TITLE, "version": settings.APP_VERSION}
+)
+_ROOT_BODY = _json_bytes({"message": f"Welcome to {settings.APP_TITLE}", "docs": "/docs"})
+
+
 @app.get("/health", tags=["System"], summary="Liveness probe")
-def health() -> JSONResponse:
-    return JSONResponse({"status": "ok", "service": settings.APP_TITLE, "version": settings.APP_VERSION})
+async def health() -> Response:
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/kaithhealthcheck", include_in_schema=False)
-def kaith_healthcheck():
+async def kaith_healthcheck():
     return PlainTextResponse("ok")
 
 @app.get("/", include_in_schema=False)
-def root() -> JSONResponse:
-    return JSONResponse({"message": f"Welcome to {settings.APP_TITLE}", "docs": "/docs"})
+async def root() -> Response:
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
@@ -22,11 +22,11 @@ user_interests = Table(
 class Interest(Base):
     """
     Normalised catalogue of interest topics.
-    Records are inserted on first use (upsert-style via get_or_create).
+    Records are inserted on first use (bulk INSERT … ON CONFLICT DO NOTHING).
     """
     __tablename__ = "interests"
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, index=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False, index=True)
 
     def __repr__(self) -> str:
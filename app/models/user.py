@@ -16,7 +16,7 @@ class User(Base):
     __tablename__ = "users"
 
     # ── Primary key ───────────────────────────────────────────────────────────
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True, index=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
 
     # ── Identity ──────────────────────────────────────────────────────────────
     full_name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -40,7 +40,7 @@ class User(Base):
     interests: Mapped[list[Interest]] = relationship(
         "Interest",
         secondary=user_interests,
-        lazy="selectin",   # auto-loaded in a single extra query — no N+1
+        lazy="select",     # loaded on access; use selectinload(User.interests) when returned
     )
 
     def __repr__(self) -> str:
@@ -8,6 +8,7 @@ Authentication router — two endpoints:
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, OperationalError
 
@@ -20,7 +21,7 @@ from app.schemas.auth import (
     TokenResponse,
     MessageResponse,
 )
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.security import hash_password, verify_password_or_dummy, create_access_token
 
 logger = logging.getLogger(__name__)
 
@@ -30,28 +31,38 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 # ── Helper ────────────────────────────────────────────────────────────────────
 
-def _get_or_create_interest(db: Session, name: str) -> Interest:
+def _resolve_interests(db: Session, names: list[str]) -> list[Interest]:
     """
-    Retrieve an existing Interest by name, or insert it if it doesn't exist.
-    Uses a simple select-then-insert pattern safe within a single request.
-    
+    Fetch the Interests matching `names`, inserting the missing ones.
+    One bulk SELECT plus (at most) one bulk INSERT … ON CONFLICT DO NOTHING,
+    whatever the number of interests.
+
     Args:
         db: Database session
-        name: Interest name (e.g., "Technology", "AI")
-    
+        names: Deduplicated interest names (e.g., ["Technology", "AI"])
+
     Returns:
-        Interest object (either existing or newly created)
-    
-    Raises:
-        IntegrityError: If concurrent insert of same interest occurs
+        Interest objects, in the same order as `names`
     """
     try:
-        interest = db.query(Interest).filter(Interest.name == name).first()
-        if not interest:
-            interest = Interest(name=name)
-            db.add(interest)
-            db.flush()   # assign id without committing the outer transaction
-        return interest
+        found = {i.name: i for i in db.query(Interest).filter(Interest.name.in_(names))}
+        missing = [n for n in names if n not in found]
+        if missing:
+            stmt = (
+                insert(Interest)
+                # Fixed order so concurrent registrations lock rows alike (no deadlock)
+                .values([{"name": n} for n in sorted(missing)])
+                .on_conflict_do_nothing(index_elements=["name"])
+                .returning(Interest)
+            )
+            for interest in db.scalars(stmt):
+                found[interest.name] = interest
+            # Rows inserted by a concurrent request are skipped by ON CONFLICT
+            lost = [n for n in missing if n not in found]
+            if lost:
+                for interest in db.query(Interest).filter(Interest.name.in_(lost)):
+                    found[interest.name] = interest
+        return [found[n] for n in names]
     except OperationalError as e:
         logger.error(f"Database error in interest lookup: {e}")
         raise HTTPException(
@@ -86,8 +97,10 @@ def register(payload: RegisterRequest, db: Session = Depends(get_db)) -> Message
     """
     # ── 1. Duplicate email check ──────────────────────────────────────────────
     try:
-        existing = db.query(User).filter(User.email == payload.email.lower()).first()
-        if existing:
+        email_taken = db.query(
+            db.query(User.id).filter(User.email == payload.email).exists()
+        ).scalar()
+        if email_taken:
             logger.warning(f"Registration attempt with existing email: {payload.email[:5]}...")
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -103,13 +116,12 @@ def register(payload: RegisterRequest, db: Session = Depends(get_db)) -> Message
             detail={"code": "DATABASE_ERROR", "message": "Database connection failed"},
         ) from e
 
-    # ── 2. Resolve interests (get or create each one) ─────────────────────────
-    try:
-        interest_objs = [_get_or_create_interest(db, name) for name in payload.interests]
-    except HTTPException:
-        raise  # propagate database errors
+    # ── 2. Resolve interests (bulk select + insert missing) ───────────────────
+    interest_objs = _resolve_interests(db, payload.interests)
 
     # ── 3. Build user ─────────────────────────────────────────────────────────
+    # bcrypt is CPU-bound; this is a sync endpoint, so FastAPI runs it in its
+    # threadpool and the event loop keeps serving other requests meanwhile.
     try:
         hashed_pwd = hash_password(payload.password)
     except ValueError as e:
@@ -121,7 +133,7 @@ def register(payload: RegisterRequest, db: Session = Depends(get_db)) -> Message
 
     new_user = User(
         full_name=payload.full_name.strip(),
-        email=payload.email.lower(),
+        email=payload.email,
         hashed_password=hashed_pwd,
         is_active=True,
         interests=interest_objs,
@@ -179,9 +191,13 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)) -> TokenResponse
     The same 401 is returned whether the email is unknown or the
     password is wrong — this prevents user enumeration attacks.
     """
-    # ── 1. Look up user ───────────────────────────────────────────────────────
+    # ── 1. Look up user (only the columns needed to authenticate) ─────────────
     try:
-        user = db.query(User).filter(User.email == payload.email.lower()).first()
+        user = (
+            db.query(User.id, User.email, User.hashed_password, User.is_active)
+            .filter(User.email == payload.email)
+            .first()
+        )
     except OperationalError as e:
         logger.error(f"Database error during login: {e}")
         raise HTTPException(
@@ -191,7 +207,7 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)) -> TokenResponse
 
     # ── 2. Verify (always run verify to prevent timing attacks) ───────────────
     # Always verify even if user doesn't exist to prevent timing attacks
-    password_valid = verify_password(payload.password, user.hashed_password if user else "")
+    password_valid = verify_password_or_dummy(payload.password, user.hashed_password if user else None)
     
     if not user or not password_valid:
         logger.warning(f"Failed login attempt for: {payload.email[:5]}...")
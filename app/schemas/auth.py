@@ -37,21 +37,20 @@ class RegisterRequest(BaseModel):
             raise ValueError("Full name must not be blank.")
         return v.strip()
 
+    @field_validator("email", mode="after")
+    @classmethod
+    def email_lowercase(cls, v: str) -> str:
+        return v.lower()
+
     @field_validator("interests")
     @classmethod
     def interests_not_empty(cls, v: List[str]) -> List[str]:
         if not v:
             raise ValueError("Select at least one area of interest.")
-        cleaned: List[str] = []
-        seen: set[str] = set()
-        for item in v:
-            s = item.strip()
-            if not s:
-                raise ValueError("Interest values must not be empty strings.")
-            if s not in seen:
-                seen.add(s)
-                cleaned.append(s)
-        return cleaned
+        cleaned = [item.strip() for item in v]
+        if not all(cleaned):
+            raise ValueError("Interest values must not be empty strings.")
+        return list(dict.fromkeys(cleaned))  # dedupe, preserving order
 
 
 # ─── Login ────────────────────────────────────────────────────────────────────
@@ -61,6 +60,11 @@ class LoginRequest(BaseModel):
     email:    EmailStr = Field(..., examples=["jane@example.com"])
     password: str      = Field(..., min_length=1, examples=["securepass123"])
 
+    @field_validator("email", mode="after")
+    @classmethod
+    def email_lowercase(cls, v: str) -> str:
+        return v.lower()
+
 
 # ─── Responses ────────────────────────────────────────────────────────────────
 
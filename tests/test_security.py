@@ -0,0 +1,38 @@
+"""
+tests/test_security.py — password verification edge cases.
+"""
+import pytest
+
+from app.config import get_settings
+from app.core.security import hash_password, verify_password_or_dummy
+
+
+@pytest.fixture(autouse=True)
+def fast_bcrypt(monkeypatch):
+    monkeypatch.setenv("BCRYPT_ROUNDS", "4")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+def test_unknown_user_never_authenticates():
+    assert verify_password_or_dummy("x" * 16, None) is False
+
+
+def test_empty_stored_hash_never_authenticates():
+    assert verify_password_or_dummy("x" * 16, "") is False
+
+
+def test_matching_password_authenticates():
+    hashed = hash_password("securepass123")
+    assert verify_password_or_dummy("securepass123", hashed) is True
+    assert verify_password_or_dummy("wrongpass123", hashed) is False
+
+
+def test_prepare_dummy_hash_caches_configured_cost():
+    from app.core.security import _dummy_hash, prepare_dummy_hash
+
+    _dummy_hash.cache_clear()
+    prepare_dummy_hash()
+    assert _dummy_hash.cache_info().currsize == 1
+    assert _dummy_hash(4).startswith("$2b$04$")